@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import inspect
 import typing
 
 if typing.TYPE_CHECKING:
@@ -12,105 +11,285 @@ if typing.TYPE_CHECKING:
 
 TC = typing.TypeVar("TC", bound="TypedClass")
 
+# Sentinel for parameters that were not passed.
+_MISSING = object()
 
-def apply_from_typing_origin(origin, tc: TypedClass, val: typing.Any, tp: type, name: str):
-    args = typing.get_args(tp)
 
-    if origin is typing.Union and args[1] is type(None) and len(args) == 2:
-        # typing.Optional[tp] is used which is internally taken
-        # as typing.Union[tp, None] so args[0] would be our required type.
+class FieldDescriptor(typing.NamedTuple):
+    """A pre-resolved annotation of a parameter.
 
-        if val is not None and not isinstance(val, args[0]):
-            raise TypeError(f"Parameter {name!r} in {tc.__class__.__name__}() must be None or " \
-                            f"{args[0]!r}, Not {val.__class__!r}")
+    ``kind`` tells how a value is validated and ``tp`` what it is validated
+    against, e.g. a class, a tuple of classes, a set of literal values or the
+    bound of a :py-class:`typing.Type`. ``plan`` is the predicates for the
+    generic arguments of a :py-class:`typing.Union` and ``err_prefix`` the
+    constant part of the error raised when a value is invalid.
+    """
 
-        return setattr(tc, name, val)
+    kind: str
+    tp: typing.Any
+    name: str
+    plan: typing.Tuple[typing.Callable[[typing.Any], bool], ...]
+    err_prefix: str
 
-    elif origin is typing.Union:
-        for arg in args:
-            origin = typing.get_origin(arg)
+def resolve_descriptor(tp: typing.Any, name: str, cls_name: str) -> FieldDescriptor:
+    """Decodes the annotation of a parameter into a :class:`FieldDescriptor`.
 
-            if origin is not None:
-                try:
-                    apply_from_typing_origin(origin, tc, val, arg, name)
-                except TypeError:
-                    continue
-                else:
-                    return
+    Everything needed to validate a value, including the error message
+    prefix, is resolved here so that no :py-module:`typing` function has to
+    be called at instantiation time. ``name`` and ``cls_name`` are the names
+    of the parameter and its class.
+    """
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
 
-            if isinstance(val, arg):
-                setattr(tc, name, val)
-                return
+    value = None
+    plan = ()
 
-        raise TypeError(f"Parameter {name!r} in {tc.__class__.__name__}() must be an instance " \
-                        f"of one of {', '.join(repr(arg) for arg in args)}, Not {val.__class__!r}")
+    if tp is typing.Any:
+        kind = "any"
+
+    elif origin is None:
+        kind = "plain"
+        value = tp
+
+    elif origin is typing.Union:
+        plain_args = []
+        generic_args = []
 
-    elif origin is typing.Literal:
         for arg in args:
-            if val is arg:
-                setattr(tc, name, tp)
-                return
+            if typing.get_origin(arg) is None:
+                plain_args.append(arg)
+            else:
+                generic_args.append(arg)
+
+        if args[1] is type(None) and len(args) == 2 and not generic_args:
+            # typing.Optional[tp] is used which is internally taken
+            # as typing.Union[tp, None] so args[0] would be our required type.
+            kind = "optional"
+            value = args[0]
+        elif not generic_args:
+            kind = "union_plain"
+            value = args
+        else:
+            # The plain arguments are checked with a single isinstance() call
+            # and the generic ones with a validation plan built once so that
+            # checking them is a loop over predicates, without recursion or
+            # catching TypeError.
+            kind = "union_mixed"
+            value = tuple(plain_args)
+            plan = tuple(build_checker(arg) for arg in generic_args)
 
-        raise TypeError(f"Parameter {name!r} in {tc.__class__.__name__}() must be exactly one " \
-                        f"of {', '.join(repr(arg) for arg in args)}, Not {val!r}")
+    elif origin is typing.Literal:
+        # The values are paired with their type as PEP 586 keeps equal values
+        # of different types, e.g. Literal[1] and Literal[True], distinct.
+        kind = "literal"
+        value = _literal_values(args)
 
     elif origin is type: # typing.Type
-        if not inspect.isclass(val) or not issubclass(val, args[0]):
-            raise TypeError(f"Parameter {name!r} in {tc.__class__.__name__}() must be a type "
-                            f"instance of {args[0]!r}, Not {val!r}")
+        kind = "type"
+        value = args[0]
 
-        setattr(tc, name, val)
     else:
         # unsupported origin, ignore it.
-        setattr(tc, name, val)
-
-def apply_attr(tc: TypedClass, val: typing.Any, tp: type, name: str):
+        kind = "any"
+
+    err_prefix = _error_prefix(kind, value, args, name, cls_name)
+    return FieldDescriptor(kind, value, name, plan, err_prefix)
+
+def _literal_values(args: typing.Tuple[typing.Any, ...]) -> typing.Collection[typing.Tuple[type, typing.Any]]:
+    # Returns the (type, value) pairs of the arguments of a typing.Literal,
+    # as a frozenset unless some of the values are unhashable.
+    values = tuple((type(arg), arg) for arg in args)
+
+    try:
+        return frozenset(values)
+    except TypeError:
+        # unhashable literal values, fallback to a linear scan.
+        return values
+
+def _error_prefix(kind: str, tp: typing.Any, args: typing.Tuple[typing.Any, ...], name: str, cls_name: str) -> str:
+    # Returns the constant part of the TypeError message raised when a
+    # value is invalid for a descriptor of the given kind.
+    prefix = f"Parameter {name!r} in {cls_name}() must be "
+
+    if kind == "plain":
+        return prefix + f"an instance of {tp!r}, Not "
+    if kind == "optional":
+        return prefix + f"None or {tp!r}, Not "
+    if kind == "union_plain" or kind == "union_mixed":
+        return prefix + f"an instance of one of {', '.join(repr(arg) for arg in args)}, Not "
+    if kind == "literal":
+        return prefix + f"exactly one of {', '.join(repr(arg) for arg in args)}, Not "
+    if kind == "type":
+        return prefix + f"a type instance of {tp!r}, Not "
+
+    return ""
+
+def _scan_literal(val: typing.Any, values: typing.Iterable[typing.Tuple[type, typing.Any]]) -> bool:
+    # Linear scan over the (type, value) pairs of a typing.Literal, used
+    # when the value is unhashable.
+    return any(tp is type(val) and (arg is val or arg == val) for tp, arg in values)
+
+def build_checker(tp: typing.Any) -> typing.Callable[[typing.Any], bool]:
+    # Returns a predicate telling whether a value is valid for the given
+    # generic argument of a typing.Union. The plain arguments are never
+    # passed here, all of them are checked by a single isinstance() call.
     origin = typing.get_origin(tp)
 
-    if origin is not None:
-        apply_from_typing_origin(origin, tc, val, tp, name)
-        return
-
-    if tp is typing.Any:
-        setattr(tc, name, val)
-        return
-
-    elif not isinstance(val, tp):
-        raise TypeError(f"Parameter {name!r} in {tc.__class__.__name__}() must be an " \
-                        f"instance of {tp!r}, Not {val.__class__!r}")
-
-    setattr(tc, name, val)
-
-def prepare_typed_instance(tc: TC, params: typing.Dict[str, typing.Any]) -> TC:
-    options = tc.__tc_options__
-
-    required_params = options["required_params"]
-    optional_params = options["optional_params"]
-
-    missing_params = []
-
-    for p_name, p_type in required_params.items():
-        if not p_name in params:
-            missing_params.append(p_name)
-            continue
-
-        apply_attr(tc, params[p_name], p_type, p_name)
-        params.pop(p_name)
-
-
-    if missing_params:
-        raise TypeError(f"{tc.__class__.__name__}() is missing required parameters " \
-                        f"{', '.join(repr(p) for p in missing_params)}")
-
-    for p_name, p_type in optional_params.items():
-        if not p_name in params:
-            continue
-
-        apply_attr(tc, params[p_name], p_type, p_name)
-        params.pop(p_name)
-
-    if params and not options.get("ignore_extra", False):
-        raise TypeError(f"{tc.__class__.__name__}() got unexpected parameters " \
-                        f"{', '.join(repr(p) for p in params)}")
-
-    return tc
\ No newline at end of file
+    if origin is typing.Literal:
+        values = _literal_values(typing.get_args(tp))
+
+        def check_literal(val: typing.Any) -> bool:
+            try:
+                return (type(val), val) in values
+            except TypeError:
+                return _scan_literal(val, values)
+
+        return check_literal
+
+    if origin is type: # typing.Type
+        bound = typing.get_args(tp)[0]
+        return lambda val: isinstance(val, type) and issubclass(val, bound)
+
+    return lambda val: True
+
+def _compile_check(fd: FieldDescriptor, ns: typing.Dict[str, typing.Any]) -> typing.List[str]:
+    # Returns the source lines that validate the value bound to 'v' in the
+    # generated function. Every descriptor kind is inlined so no helper
+    # function is called per parameter.
+    ref = f"_t{len(ns)}"
+    kind = fd.kind
+
+    if kind == "plain":
+        # No 'type(v) is tp' guard here, isinstance() already returns early
+        # when the exact type matches so the guard would only add a call.
+        ns[ref] = fd.tp
+        return [
+            f"if not isinstance(v, {ref}):",
+            f"    raise TypeError({fd.err_prefix!r} + repr(v.__class__))",
+        ]
+
+    if kind == "optional":
+        ns[ref] = fd.tp
+        return [
+            f"if v is not None and not isinstance(v, {ref}):",
+            f"    raise TypeError({fd.err_prefix!r} + repr(v.__class__))",
+        ]
+
+    if kind == "union_plain":
+        ns[ref] = fd.tp
+        return [
+            f"if not isinstance(v, {ref}):",
+            f"    raise TypeError({fd.err_prefix!r} + repr(v.__class__))",
+        ]
+
+    if kind == "union_mixed":
+        plan_ref = f"_t{len(ns) + 1}"
+        ns[ref] = fd.tp
+        ns[plan_ref] = fd.plan
+        return [
+            f"if not isinstance(v, {ref}):",
+            f"    for check in {plan_ref}:",
+            "        if check(v):",
+            "            break",
+            "    else:",
+            f"        raise TypeError({fd.err_prefix!r} + repr(v.__class__))",
+        ]
+
+    if kind == "literal":
+        ns[ref] = fd.tp
+        return [
+            "try:",
+            f"    found = (type(v), v) in {ref}",
+            "except TypeError:",
+            f"    found = _scan_literal(v, {ref})",
+            "if not found:",
+            f"    raise TypeError({fd.err_prefix!r} + repr(v))",
+        ]
+
+    if kind == "type":
+        ns[ref] = fd.tp
+        return [
+            f"if not isinstance(v, type) or not issubclass(v, {ref}):",
+            f"    raise TypeError({fd.err_prefix!r} + repr(v))",
+        ]
+
+    # "any" descriptors accept every value.
+    return []
+
+def _compile_field(fd: FieldDescriptor, ns: typing.Dict[str, typing.Any]) -> typing.List[str]:
+    # Returns the source lines that validate and set the value bound to 'v'.
+    # The validation is done under 'if __debug__:' so that the compiler
+    # strips it when Python is run with -O.
+    #
+    # The value is set with a plain attribute store rather than through
+    # self.__dict__ or the slot's __set__, the interpreter specializes the
+    # store for both dict and slotted instances which makes it the fastest.
+    name = fd.name
+    check = _compile_check(fd, ns)
+
+    if not check:
+        return [f"self.{name} = v"]
+
+    lines = ["if __debug__:"]
+    lines.extend(f"    {line}" for line in check)
+    lines.append(f"self.{name} = v")
+    return lines
+
+def build_tc_init(cls: typing.Type[TypedClass]) -> typing.Callable[[TypedClass, typing.Dict[str, typing.Any]], None]:
+    """Generates the ``__tc_init__`` function for a typed class.
+
+    The returned function validates and sets the parameters on the instance
+    using straight-line code specialized for the class's annotations so no
+    annotation is inspected again at instantiation time.
+    """
+    options = cls.__tc_options__
+    cls_name = cls.__name__
+    ns: typing.Dict[str, typing.Any] = {
+        "_MISSING": _MISSING,
+        "_scan_literal": _scan_literal,
+        "_all_names": options["all_names"],
+    }
+
+    lines = [
+        "def __tc_init__(self, params):",
+        "    missing = []",
+    ]
+
+    for fd in options["required_params"]:
+        p_name = fd.name
+        lines.append(f"    v = params.get({p_name!r}, _MISSING)")
+        lines.append("    if v is _MISSING:")
+        lines.append(f"        missing.append({p_name!r})")
+        lines.append("    else:")
+        lines.extend(f"        {line}" for line in _compile_field(fd, ns))
+
+    prefix = f"{cls_name}() is missing required parameters "
+    lines.append("    if missing:")
+    lines.append(f"        raise TypeError({prefix!r} + ', '.join(repr(p) for p in missing))")
+
+    slot_defaults = options["slot_defaults"]
+
+    for fd in options["optional_params"]:
+        p_name = fd.name
+        lines.append(f"    v = params.get({p_name!r}, _MISSING)")
+        lines.append("    if v is not _MISSING:")
+        lines.extend(f"        {line}" for line in _compile_field(fd, ns))
+
+        if p_name in slot_defaults:
+            # the default value is shadowed by a slot, so set it explicitly.
+            ref = f"_t{len(ns)}"
+            ns[ref] = slot_defaults[p_name]
+            lines.append("    else:")
+            lines.append(f"        self.{p_name} = {ref}")
+
+    if not options.get("ignore_extra", False):
+        prefix = f"{cls_name}() got unexpected parameters "
+        lines.append("    if not _all_names.issuperset(params):")
+        lines.append(f"        raise TypeError({prefix!r} + ', '.join(repr(p) for p in params if p not in _all_names))")
+
+    exec("\n".join(lines), ns)
+
+    func = ns["__tc_init__"]
+    func.__qualname__ = f"{cls.__qualname__}.__tc_init__"
+    return func
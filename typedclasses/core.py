@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
-from typedclasses._internal import prepare_typed_instance
+from typedclasses._internal import _MISSING, build_tc_init, resolve_descriptor
+import inspect
+import sys
+import types
 import typing
 
 TC = typing.TypeVar("TC", bound="TypedClass")
@@ -13,6 +16,116 @@ def _typed_class_repr(self: TypedClass) -> str:
     params = self.__tc_options__["params"]
     return ret % (", ".join(f"{k}={getattr(self, k)!r}" for k in params))
 
+def _is_parameter(name: str, tp: typing.Any, ignore_internal: bool) -> bool:
+    if tp is typing.ClassVar or typing.get_origin(tp) is typing.ClassVar:
+        return False
+    if name.startswith("__"):
+        return False
+    if name.startswith("_") and ignore_internal:
+        return False
+
+    return True
+
+def _get_slots(klass: type) -> typing.Tuple[str, ...]:
+    slots = vars(klass).get("__slots__", ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+def _own_annotations(klass: type) -> typing.Mapping[str, typing.Any]:
+    # Returns the annotations defined in the body of klass only, class
+    # attribute lookup of __annotations__ falls back to the bases before 3.10.
+    if sys.version_info >= (3, 10):
+        return inspect.get_annotations(klass)
+
+    return vars(klass).get("__annotations__", {})
+
+def _get_default(base: type, name: str) -> typing.Any:
+    # Returns the default value that base sets for the parameter name or
+    # _MISSING. Only the values of the parameters annotated in base count,
+    # functions and other descriptors (e.g. slots) are never defaults.
+    value = vars(base).get("__tc_defaults__", {}).get(name, _MISSING)
+    if value is not _MISSING:
+        return value
+    if name not in _own_annotations(base):
+        return _MISSING
+
+    value = vars(base).get(name, _MISSING)
+    if hasattr(type(value), "__get__"):
+        return _MISSING
+
+    return value
+
+def _find_slot_defaults(cls: typing.Type[TypedClass], names: typing.Iterable[str]) -> typing.Dict[str, typing.Any]:
+    # Returns the default values that are shadowed by a slot and so have to
+    # be set on the instance, walking the MRO like attribute lookup does.
+    defaults = dict()
+
+    for name in names:
+        shadowed = False
+
+        for base in cls.__mro__:
+            base_vars = vars(base)
+
+            value = base_vars.get("__tc_defaults__", {}).get(name, _MISSING)
+            if value is not _MISSING:
+                # moved out of the class namespace by with_slots().
+                defaults[name] = value
+                break
+
+            if isinstance(base_vars.get(name), types.MemberDescriptorType):
+                shadowed = True
+                continue
+
+            value = _get_default(base, name)
+            if value is not _MISSING:
+                if shadowed:
+                    defaults[name] = value
+                break
+
+    return defaults
+
+def _prepare_typed_class(cls: typing.Type[TypedClass]) -> None:
+    # Resolves the annotations of a typed class and generates its __tc_init__.
+    options = cls.__tc_options__
+
+    # cls.__annotations__ may have stringified values when using
+    # 'from __future__ import annotations' so using typing.get_type_hints()
+    # to get proper annotations.
+
+    annotations = typing.get_type_hints(cls)
+    ignore_internal = options["ignore_internal"]
+
+    params = [name for name, tp in annotations.items() if _is_parameter(name, tp, ignore_internal)]
+
+    # Parameters that have a value set on the class, or inherit one from
+    # a base class annotating them, have a default value and are optional.
+    bases = [base for base in cls.__mro__ if base is not TypedClass and base is not object]
+    defaulted = {
+        name for name in params
+        if any(_get_default(base, name) is not _MISSING for base in bases)
+    }
+
+    # The parameters are fixed from now on so they are stored as tuples
+    # of field descriptors.
+    options["optional_params"] = tuple(
+        resolve_descriptor(annotations[name], name, cls.__name__) for name in params if name in defaulted
+    )
+    options["required_params"] = tuple(
+        resolve_descriptor(annotations[name], name, cls.__name__) for name in params if name not in defaulted
+    )
+
+    options["params"] = params
+    options["all_names"] = frozenset(params)
+    options["slot_defaults"] = _find_slot_defaults(cls, defaulted)
+
+    cls.__tc_init__ = build_tc_init(cls)
+
+def _lazy_tc_init(self: TypedClass, params: typing.Dict[str, typing.Any]) -> None:
+    # The initial __tc_init__ of every typed class, replaces itself with
+    # the generated one on the first instantiation.
+    cls = self.__class__
+    _prepare_typed_class(cls)
+    cls.__tc_init__(self, params)
+
 class TypedClass:
     """Represents a typed class that provides robust type validation at runtime.
 
@@ -38,6 +151,14 @@ class TypedClass:
     Support for other generic types will also be added soon. If you want to suggest
     one, Consider opening an issue on our GitHub repository!
 
+    Annotations are resolved when the class is instantiated for the first time
+    rather than when it is defined so they may contain forward references to
+    classes defined later in the module.
+
+    The type validation is skipped when Python is run with the :option:`-O` flag,
+    in which case the parameters are only set on the instance. Missing and
+    unexpected parameters are still reported.
+
     Subclassing Parameters
     ----------------------
     ignore_internal: :class:`builtins.bool`
@@ -48,16 +169,58 @@ class TypedClass:
         Defaults to ``False``.
     repr: :class:`builtins.bool`
         Whether to add a ``__repr__`` method to the class. Defaults to ``True``.
+
+    To add ``__slots__`` for the parameters of a typed class, decorate it
+    with :func:`with_slots`.
     """
 
+    __slots__ = ()
+
     __tc_options__: typing.Dict[str, typing.Any]
+    __tc_init__: typing.Callable[[typing.Any, typing.Dict[str, typing.Any]], None]
 
     def __new__(cls: type[TC], *args, **kwargs) -> TC:
         if args:
             raise TypeError(f"{cls.__name__}() takes no positional arguments.")
 
         instance = super().__new__(cls)
-        return prepare_typed_instance(instance, kwargs)
+        cls.__tc_init__(instance, kwargs)
+        return instance
+
+    @classmethod
+    def from_iter(cls: typing.Type[TC], rows: typing.Iterable[typing.Mapping[str, typing.Any]]) -> typing.List[TC]:
+        """Creates an instance of the class for each mapping of parameters in ``rows``.
+
+        The parameters are validated like in ``cls(**row)`` but without the per
+        instance overhead of unpacking keyword arguments, which is useful when
+        creating a large number of instances e.g. from a parsed JSON list.
+
+        Note that unlike normal instantiation, the instances are created using
+        ``object.__new__`` so any ``__new__`` or ``__init__`` defined by
+        the class or its bases is not called.
+
+        Parameters
+        ----------
+        rows: Iterable[Mapping[:class:`builtins.str`, Any]]
+            The parameters of each instance. The mappings are not modified.
+
+        Returns
+        -------
+        List[:class:`TypedClass`]
+        """
+        if cls.__tc_init__ is _lazy_tc_init:
+            _prepare_typed_class(cls)
+
+        new = super().__new__
+        init = cls.__tc_init__
+        ret = []
+
+        for row in rows:
+            instance = new(cls)
+            init(instance, row)
+            ret.append(instance)
+
+        return ret
 
     def __init_subclass__(cls,
         ignore_internal: bool = True,
@@ -69,45 +232,92 @@ class TypedClass:
 
         # Passing parameters to options
         options["ignore_extra"] = ignore_extra
+        options["ignore_internal"] = ignore_internal
+        options["repr"] = repr
 
-        optional_params = options.get("optional_params", dict())
-        required_params = options.get("required_params", dict())
-
-        members = vars(cls)
+        # Annotations are only resolved when the class is instantiated
+        # for the first time, see _prepare_typed_class().
+        cls.__tc_init__ = _lazy_tc_init
 
-        # cls.__annotations__ may have stringified values when using
-        # 'from __future__ import annotations' so using typing.get_type_hints()
-        # to get proper annotations.
+        if repr:
+            cls.__repr__ = _typed_class_repr
 
-        annotations = typing.get_type_hints(cls)
-        params = []
+def _update_class_cells(namespace: typing.Dict[str, typing.Any], old: type, new: type) -> None:
+    # Points the __class__ cells, used by super() without arguments in
+    # methods, from the old class to the rebuilt one.
+    for value in namespace.values():
+        if isinstance(value, property):
+            funcs = (value.fget, value.fset, value.fdel)
+        else:
+            funcs = (getattr(value, "__func__", value),)
 
-        for name, tp in annotations.items():
-            if name.startswith("__"):
-                continue
-            if name.startswith("_") and ignore_internal:
+        for func in funcs:
+            code = getattr(func, "__code__", None)
+            if code is None or not func.__closure__:
                 continue
 
-            if name in members:
-                if name in required_params:
-                    # name can be in required_params when inheriting
-                    # a typed class, so remove it.
-                    required_params.pop(name)
+            for name, cell in zip(code.co_freevars, func.__closure__):
+                if name == "__class__" and cell.cell_contents is old:
+                    cell.cell_contents = new
+
+def with_slots(cls: typing.Type[TC]) -> typing.Type[TC]:
+    """A class decorator that rebuilds a typed class with ``__slots__`` for its parameters.
 
-                optional_params[name] = tp
-            else:
-                if name in optional_params:
-                    optional_params.pop(name)
+    This makes the instances smaller and setting the parameters faster but,
+    like any slotted class, prevents setting attributes that aren't in the slots.
 
-                required_params[name] = tp
+    Example::
 
-            params.append(name)
+        @typedclasses.with_slots
+        class User(typedclasses.TypedClass):
+            id: int
+            name: str = "anon"
 
-        # Update the options with new ones.
-        options["optional_params"] = optional_params
-        options["required_params"] = required_params
+    Unlike other typed classes, the annotations are resolved when the class is
+    decorated so they can't contain forward references to classes defined later.
+    As the class is rebuilt, ``__init_subclass__`` of its base classes is called
+    again for the new class.
+    """
+    if not isinstance(cls, type) or not issubclass(cls, TypedClass) or cls is TypedClass:
+        raise TypeError("with_slots() can only be used on subclasses of TypedClass")
 
-        options["params"] = params
+    options = cls.__tc_options__
+    namespace = dict(vars(cls))
+    inherited = {slot for base in cls.__mro__[1:] for slot in _get_slots(base)}
 
-        if repr:
-            cls.__repr__ = _typed_class_repr
\ No newline at end of file
+    slots = list(_get_slots(cls))
+    defaults = dict()
+
+    # the slots already defined in the class body are recreated by type().
+    for slot in slots:
+        namespace.pop(slot, None)
+
+    for p_name, tp in typing.get_type_hints(cls).items():
+        if not _is_parameter(p_name, tp, options["ignore_internal"]):
+            continue
+
+        # class variables conflict with the slots, so the default
+        # values are stored separately and set on the instance.
+        value = namespace.pop(p_name, _MISSING)
+        if value is not _MISSING:
+            defaults[p_name] = value
+        if p_name not in inherited and p_name not in slots:
+            slots.append(p_name)
+
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(slots)
+    namespace["__tc_defaults__"] = defaults
+
+    new_cls = type(cls)(
+        cls.__name__,
+        cls.__bases__,
+        namespace,
+        ignore_internal=options["ignore_internal"],
+        ignore_extra=options["ignore_extra"],
+        repr=options["repr"],
+    )
+    new_cls.__qualname__ = cls.__qualname__
+
+    _update_class_cells(namespace, cls, new_cls)
+    return new_cls